@@ -1,32 +1,56 @@
 # quiz_application.py
 
 import argparse
+import copy
+import functools
 import sys
 import os
-import json
 import logging
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from quiz_data import QuizData
 from quiz_core import EnvironmentHandler, Quiz
 
-def load_config(config_file='config.json'):
+@functools.lru_cache(maxsize=16)
+def _read_config_cached(config_file, cache_key):
+    """Read and parse a config file.
+
+    Cached per (absolute path, cache_key), where cache_key is the file's
+    (st_mtime_ns, st_size), so an edited file is read again. Tests can reset
+    the cache with _read_config_cached.cache_clear().
+    """
+    with open(config_file, 'rb') as f:
+        return _json_loads(f.read())
+
+def load_config(config_file='config.json', _override_data=None):
     """Load configuration from a JSON file.
 
     Args:
         config_file (str): Path to the config file.
+        _override_data (dict): Already-parsed configuration to return in
+            place of reading a file. Intended for tests.
 
     Returns:
         dict: Configuration dictionary.
     """
-    config = {}
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-        except json.JSONDecodeError as e:
-            logging.error(f"Error parsing config file: {e}")
-            sys.exit(1)
-    return config
+    if _override_data is not None:
+        return copy.deepcopy(_override_data)
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return {}
+    try:
+        config = _read_config_cached(os.path.abspath(config_file),
+                                     (stat.st_mtime_ns, stat.st_size))
+    except ValueError as e:
+        logging.error(f"Error parsing config file: {e}")
+        sys.exit(1)
+    # Hand out a copy so callers that mutate it cannot poison the cache.
+    return copy.deepcopy(config)
 
 def setup_logging(logging_enabled=True):
     """Set up logging configuration.
@@ -3,7 +3,8 @@
 import sys
 import logging
 import random
-import re
+
+_FILE_BUFFER_SIZE = 1 << 16
 
 class EnvironmentHandler:
     """Handles input and output operations based on the environment mode."""
@@ -20,8 +21,10 @@ class EnvironmentHandler:
         self.mode = mode
         if mode == 'file':
             try:
-                self.input_fd = open(input_file, 'r', encoding='utf-8')
-                self.output_fd = open(output_file, 'w', encoding='utf-8')
+                self.input_fd = open(input_file, 'r', encoding='utf-8',
+                                     buffering=_FILE_BUFFER_SIZE)
+                self.output_fd = open(output_file, 'w', encoding='utf-8',
+                                      buffering=_FILE_BUFFER_SIZE)
             except IOError as e:
                 logging.error(f"Error opening files: {e}")
                 sys.exit(1)
@@ -54,25 +57,39 @@ class EnvironmentHandler:
         Args:
             text (str): The text to output.
         """
-        print(text, file=self.output_fd)
+        if self.mode == 'file':
+            self.output_fd.write(text)
+            self.output_fd.write('\n')
+        else:
+            print(text, file=self.output_fd)
+
+    def flush(self):
+        """Flush any buffered output."""
+        self.output_fd.flush()
 
     def close(self):
         """Close any open file descriptors."""
         if self.mode == 'file':
+            self.flush()
             self.input_fd.close()
             self.output_fd.close()
 
 class CommandProcessor:
     """Processes commands entered by the user."""
 
-    def __init__(self):
-        """Initialize the CommandProcessor."""
-        self.commands = {
-            'restart': ['restart', 'r'],
-            'skip': ['skip', 's', 'n', 'next'],
-            'quit': ['quit', 'q'],
-            'help': ['help', 'h', '?']
-        }
+    commands = {
+        'restart': ['restart', 'r'],
+        'skip': ['skip', 's', 'n', 'next'],
+        'quit': ['quit', 'q'],
+        'help': ['help', 'h', '?']
+    }
+    # Built once for the class: the alias table is inverted so lookups are
+    # a single dict probe, and the help text never changes.
+    _ALIAS_TO_CMD = {alias: command
+                     for command, aliases in commands.items()
+                     for alias in aliases}
+    _HELP_TEXT = "Available commands:\n" + "".join(
+        f"  {', '.join(aliases)}\n" for aliases in commands.values())
 
     def is_command(self, input_str):
         """Check if the input string is a command.
@@ -83,11 +100,7 @@ class CommandProcessor:
         Returns:
             bool: True if it's a command, False otherwise.
         """
-        input_str = input_str.lower()
-        for aliases in self.commands.values():
-            if input_str in aliases:
-                return True
-        return False
+        return input_str.lower() in self._ALIAS_TO_CMD
 
     def process_command(self, input_str):
         """Process the input command.
@@ -98,11 +111,7 @@ class CommandProcessor:
         Returns:
             str or None: The command name or None if not recognized.
         """
-        input_str = input_str.lower()
-        for command, aliases in self.commands.items():
-            if input_str in aliases:
-                return command
-        return None
+        return self._ALIAS_TO_CMD.get(input_str.lower())
 
     def get_help_text(self):
         """Get help text for available commands.
@@ -110,10 +119,7 @@ class CommandProcessor:
         Returns:
             str: Help text.
         """
-        help_text = "Available commands:\n"
-        for command, aliases in self.commands.items():
-            help_text += f"  {', '.join(aliases)}\n"
-        return help_text
+        return self._HELP_TEXT
 
 class Quiz:
     """Main class for running the quiz."""
@@ -133,26 +139,38 @@ class Quiz:
         self.incorrect_questions = []
         self.skipped_questions = []
         self.question_index = 0
+        self._play_order = self._new_play_order()
+
+    def _new_play_order(self):
+        """Pick a random order of question indices, limited to the quiz length.
+
+        Returns:
+            list: Indices into quiz_data.questions in the order they are asked.
+        """
+        total = len(self.quiz_data.questions)
+        quiz_length = self.quiz_data.quiz_length
+        length = quiz_length if 0 < quiz_length < total else total
+        return random.sample(range(total), length)
 
     def start(self):
         """Start the quiz."""
         self.display_quiz_info()
-        random.shuffle(self.quiz_data.questions)
-        while self.question_index < len(self.quiz_data.questions):
-            question = self.quiz_data.questions[self.question_index]
-            self.ask_question(question)
+        questions = self.quiz_data.questions
+        ask = self.ask_question
+        # The play order is re-read each pass because restart_quiz replaces it.
+        while self.question_index < len(self._play_order):
+            ask(questions[self._play_order[self.question_index]])
             self.question_index += 1
         self.show_results()
         self.env_handler.close()
 
     def display_quiz_info(self):
         """Display quiz title and description."""
-        if self.quiz_data.quiz_info.get('title'):
-            self.env_handler.output(f"=== {self.quiz_data.quiz_info['title']} ===")
-        if self.quiz_data.quiz_info.get('subtitle'):
-            self.env_handler.output(self.quiz_data.quiz_info['subtitle'])
-        if self.quiz_data.quiz_info.get('description'):
-            self.env_handler.output(self.quiz_data.quiz_info['description'])
+        quiz_info = self.quiz_data.quiz_info
+        for key in ('title', 'subtitle', 'description'):
+            value = quiz_info.get(key)
+            if value:
+                self.env_handler.output(f"=== {value} ===" if key == 'title' else value)
 
     def ask_question(self, question):
         """Present a question to the user and handle the response.
@@ -160,21 +178,17 @@ class Quiz:
         Args:
             question (dict): The question to ask.
         """
-        if question.get('title'):
-            self.env_handler.output(f"\n{question['title']}")
-        if question.get('subtitle'):
-            self.env_handler.output(f"{question['subtitle']}")
-        self.env_handler.output(f"\nQuestion {self.question_index + 1}: {question['question']}")
-        for idx, option in enumerate(question['options'], start=1):
-            self.env_handler.output(f"{idx}. {option}")
+        # Rendered on each ask, so edits to a loaded question's fields show up.
+        header, body = self.quiz_data.render_question(question)
+        self.env_handler.output(f"{header}\nQuestion {self.question_index + 1}: {body}")
 
         while True:
             user_input = self.env_handler.input("Your answer (or command): ").strip()
             if not (1 <= len(user_input) <= 100):
                 self.env_handler.output("Invalid input size. Please try again.")
                 continue
-            if self.command_processor.is_command(user_input):
-                command = self.command_processor.process_command(user_input)
+            command = self.command_processor.process_command(user_input)
+            if command is not None:
                 if command == 'help':
                     self.env_handler.output(self.command_processor.get_help_text())
                 elif command == 'skip':
@@ -191,10 +205,11 @@ class Quiz:
                 else:
                     self.env_handler.output("Unknown command. Type 'help' for available commands.")
             else:
-                if not user_input.isdigit():
+                try:
+                    option_number = int(user_input)
+                except ValueError:
                     self.env_handler.output("Invalid input. Please enter a valid option number or command.")
                     continue
-                option_number = int(user_input)
                 if not (1 <= option_number <= len(question['options'])):
                     self.env_handler.output("Invalid option number. Please try again.")
                     continue
@@ -211,17 +226,18 @@ class Quiz:
         self.correct_answers = 0
         self.incorrect_questions = []
         self.skipped_questions = []
-        self.question_index = 0
-        random.shuffle(self.quiz_data.questions)
+        # start() advances question_index once ask_question returns, so the
+        # first question of the new order is asked next.
+        self.question_index = -1
+        self._play_order = self._new_play_order()
 
     def show_results(self):
         """Display the quiz results to the user."""
-        total_questions = len(self.quiz_data.questions)
-        self.env_handler.output("\nQuiz Completed!")
-        self.env_handler.output(f"Your score: {self.correct_answers}/{total_questions}")
+        total_questions = len(self._play_order)
+        lines = ["\nQuiz Completed!", f"Your score: {self.correct_answers}/{total_questions}"]
         if self.incorrect_questions:
-            self.env_handler.output("\nYou missed the following questions:")
-            for question in self.incorrect_questions:
-                self.env_handler.output(f"- {question['question']}")
+            lines.append("\nYou missed the following questions:")
+            lines.extend(f"- {question['question']}" for question in self.incorrect_questions)
         if self.skipped_questions:
-            self.env_handler.output(f"\nSkipped questions: {len(self.skipped_questions)}")
+            lines.append(f"\nSkipped questions: {len(self.skipped_questions)}")
+        self.env_handler.output('\n'.join(lines))
@@ -1,97 +1,255 @@
 # quiz_data.py
 
-import json
 import sys
-import re
+import os
 import logging
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_MAX_TEXT_LEN = 1000
+# Quiz files larger than this many bytes are stream-parsed when ijson is available.
+_STREAM_THRESHOLD = 1 << 20
+_PARSE_ERRORS = (IOError, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+# Loaded quiz files, keyed on (class, absolute path, st_mtime_ns, st_size,
+# sanitization policy); the oldest entry is evicted past _LOAD_CACHE_SIZE.
+_LOAD_CACHE = {}
+_LOAD_CACHE_SIZE = 16
+_INFO_FIELDS = ('title', 'subtitle', 'description')
+# Question fields holding free text; 'options' is sanitized separately.
+_TEXT_FIELDS = ('question', 'title', 'subtitle', 'description')
+_DISALLOWED_CHARS = '<>'
+# Per-policy translation tables for the disallowed characters.
+_TRANSLATE_TABLES = {
+    'remove': str.maketrans('', '', _DISALLOWED_CHARS),
+    'replace': str.maketrans(dict.fromkeys(_DISALLOWED_CHARS, '?'))
+}
+
+def _is_clean(text):
+    """Return True if text is within length bounds and has no disallowed characters."""
+    # One substring scan per disallowed character beats a set or a regex on long text.
+    return 1 <= len(text) <= _MAX_TEXT_LEN and not any(char in text for char in _DISALLOWED_CHARS)
+
+def _copy_questions(questions):
+    """Copy questions deep enough that callers can edit them and their options."""
+    return [dict(question, options=list(question['options'])) for question in questions]
+
 class QuizData:
     """Class responsible for loading and validating quiz data from a JSON file."""
 
-    def __init__(self, filename='quiz.json', sanitization_policy='reject', quiz_length=0):
+    def __init__(self, filename='quiz.json', sanitization_policy='reject', quiz_length=0, data=None):
         """
         Initialize the QuizData instance.
 
         Args:
             filename (str): Path to the quiz JSON file.
             sanitization_policy (str): Policy for sanitizing invalid text ('reject', 'remove', 'replace').
-            quiz_length (int): Number of questions to include in the quiz.
+            quiz_length (int): Number of questions to ask per quiz run (0 for all).
+            data (bytes or str): Raw JSON document to load instead of reading filename.
         """
         self.filename = filename
         self.sanitization_policy = sanitization_policy
         self.quiz_length = quiz_length
         self.questions = []
         self.quiz_info = {}
-        self.load_quiz_data()
+        self.load_quiz_data(data)
+
+    def load_quiz_data(self, data=None):
+        """Load and validate quiz data from the JSON file.
 
-    def load_quiz_data(self):
-        """Load and validate quiz data from the JSON file."""
+        Results are cached per file and sanitization policy until the file's
+        mtime or size changes; each load gets its own copy of the questions.
+
+        Args:
+            data (bytes or str): Raw JSON document to use instead of the file.
+        """
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self.quiz_info = {
-                'title': data.get('title', None),
-                'subtitle': data.get('subtitle', None),
-                'description': data.get('description', None)
-            }
-            raw_questions = data.get('questions', [])
-            for question in raw_questions:
-                sanitized_question = self.sanitize_question(question)
-                if sanitized_question and self.validate_question(sanitized_question):
-                    self.questions.append(sanitized_question)
+            if data is not None:
+                self.questions.extend(self._sanitize_questions(self._parse_document(data)))
+                return
+            stat = os.stat(self.filename)
+            cache_key = (type(self), os.path.abspath(self.filename),
+                         stat.st_mtime_ns, stat.st_size, self.sanitization_policy)
+            cached = _LOAD_CACHE.get(cache_key)
+            if cached is not None:
+                quiz_info, questions = cached
+                self.quiz_info = dict(quiz_info)
+                self.questions.extend(_copy_questions(questions))
+                return
+            with open(self.filename, 'rb') as f:
+                if ijson is not None and stat.st_size > _STREAM_THRESHOLD:
+                    # _stream_questions fills quiz_info as it goes; start it
+                    # empty, as _parse_document does, so a reload keeps no
+                    # stale info fields.
+                    self.quiz_info = {}
+                    questions = self._sanitize_questions(self._stream_questions(f))
                 else:
-                    logging.warning(f"Invalid question skipped: {question.get('question', 'Unknown')}")
-            if self.quiz_length > 0 and len(self.questions) > self.quiz_length:
-                self.questions = self.questions[:self.quiz_length]
-        except (IOError, json.JSONDecodeError) as e:
+                    questions = self._sanitize_questions(self._parse_document(f.read()))
+            # Cache only this file's questions, not whatever the instance held before.
+            _LOAD_CACHE[cache_key] = (dict(self.quiz_info), _copy_questions(questions))
+            self.questions.extend(questions)
+            if len(_LOAD_CACHE) > _LOAD_CACHE_SIZE:
+                del _LOAD_CACHE[next(iter(_LOAD_CACHE))]
+        except _PARSE_ERRORS as e:
             logging.error(f"Error loading quiz data: {e}")
             sys.exit(1)
 
+    def _parse_document(self, raw):
+        """Parse a whole JSON document, storing its info fields in quiz_info.
+
+        Args:
+            raw (bytes or str): The JSON document.
+
+        Returns:
+            list: The document's raw questions.
+        """
+        data = _json_loads(raw)
+        self.quiz_info = {key: data[key] for key in _INFO_FIELDS if key in data}
+        return data.get('questions', [])
+
+    def _sanitize_questions(self, raw_questions):
+        """Sanitize and validate raw questions, dropping the invalid ones.
+
+        Args:
+            raw_questions (iterable): Questions as parsed from the JSON file.
+
+        Returns:
+            list: The valid questions, sanitized and ready to display.
+        """
+        questions = []
+        for question in raw_questions:
+            sanitized_question = self.sanitize_question(question)
+            if sanitized_question and self.validate_question(sanitized_question):
+                # Short option strings ("True", "4", ...) repeat across questions;
+                # interning keeps one copy of each. Under 'reject' the sanitized
+                # question is the caller's own dict, so build a new one.
+                questions.append(dict(sanitized_question,
+                                      options=list(map(sys.intern, sanitized_question['options']))))
+            else:
+                logging.warning(f"Invalid question skipped: {question.get('question', 'Unknown')}")
+        return questions
+
+    def _stream_questions(self, f):
+        """Yield questions one at a time from an open quiz file.
+
+        Top-level info fields are stored in quiz_info as they are reached, so
+        the whole document is never held in memory at once.
+
+        Args:
+            f (file): The quiz file, opened in binary mode.
+
+        Yields:
+            The items of the top-level 'questions' array.
+        """
+        builder = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == 'questions.item' and event in ('end_map', 'end_array'):
+                    yield builder.value
+                    builder = None
+            elif prefix == 'questions.item':
+                if event in ('start_map', 'start_array'):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                else:
+                    yield value
+            elif prefix in _INFO_FIELDS and event in ('string', 'number', 'boolean', 'null'):
+                self.quiz_info[prefix] = value
+
     def validate_question(self, question):
         """Validate a single question.
 
+        'question' must be a string, 'options' a non-empty list and 'correct'
+        a 1-based int index into it; bools are rejected even though bool
+        subclasses int.
+
         Args:
             question (dict): The question to validate.
 
         Returns:
             bool: True if valid, False otherwise.
         """
-        required_fields = ['question', 'options', 'correct']
-        for field in required_fields:
-            if field not in question:
-                return False
-        if not isinstance(question['options'], list) or not question['options']:
-            return False
-        if not isinstance(question['correct'], int) or not (1 <= question['correct'] <= len(question['options'])):
-            return False
-        return True
+        # A missing field reads as None and fails its type check; the range
+        # check also rules out an empty options list.
+        options = question.get('options')
+        correct = question.get('correct')
+        return (isinstance(question.get('question'), str)
+                and type(options) is list
+                and type(correct) is int
+                and 1 <= correct <= len(options))
+
+    def render_question(self, question):
+        """Build the display text for a question, without its number.
+
+        Args:
+            question (dict): A validated question.
+
+        Returns:
+            tuple: (header, body) where header holds the optional title and
+            subtitle lines and body the question text and numbered options.
+        """
+        header = ''
+        if question.get('title'):
+            header += f"\n{question['title']}\n"
+        if question.get('subtitle'):
+            header += f"{question['subtitle']}\n"
+        body = '\n'.join([question['question']] +
+                         [f"{idx}. {option}" for idx, option in enumerate(question['options'], start=1)])
+        return header, body
 
     def sanitize_question(self, question):
-        """Sanitize all text fields in a question.
+        """Sanitize the text fields and options of a question.
 
         Args:
             question (dict): The question to sanitize.
 
         Returns:
-            dict or None: Sanitized question or None if rejected.
+            dict or None: Sanitized question or None if rejected. Under
+            'reject' this is the question itself, otherwise a copy.
         """
-        sanitized_question = {}
-        for key, value in question.items():
+        if self.sanitization_policy == 'reject':
+            # 'reject' never rewrites text, so a clean question is returned as
+            # is, without a copy; a failing value goes through sanitize_text
+            # only to log why it is rejected.
+            for key in _TEXT_FIELDS:
+                value = question.get(key)
+                if isinstance(value, str) and not _is_clean(value):
+                    self.sanitize_text(value)
+                    return None
+            options = question.get('options')
+            if isinstance(options, list):
+                for option in options:
+                    if not isinstance(option, str):
+                        return None
+                    if not _is_clean(option):
+                        self.sanitize_text(option)
+                        return None
+            return question
+
+        sanitized_question = dict(question)
+        for key in _TEXT_FIELDS:
+            value = question.get(key)
             if isinstance(value, str):
                 sanitized_text = self.sanitize_text(value)
                 if sanitized_text is None:
                     return None  # Reject the question
                 sanitized_question[key] = sanitized_text
-            elif isinstance(value, list):
-                sanitized_options = []
-                for option in value:
-                    sanitized_option = self.sanitize_text(option)
-                    if sanitized_option is None:
-                        return None  # Reject the question
-                    sanitized_options.append(sanitized_option)
-                sanitized_question[key] = sanitized_options
-            else:
-                sanitized_question[key] = value
+        options = question.get('options')
+        if isinstance(options, list):
+            if not all(isinstance(option, str) for option in options):
+                return None  # Reject the question
+            sanitized_options = [self.sanitize_text(option) for option in options]
+            if None in sanitized_options:
+                return None  # Reject the question
+            sanitized_question['options'] = sanitized_options
         return sanitized_question
 
     def sanitize_text(self, text):
@@ -103,22 +261,20 @@ class QuizData:
         Returns:
             str or None: Sanitized text or None if rejected.
         """
-        max_length = 1000
-        disallowed_patterns = re.compile(r'[<>]')  # Example pattern to reject
+        if _is_clean(text):
+            # Every policy leaves clean text as it is.
+            return text
 
-        if not (1 <= len(text) <= max_length):
+        if not (1 <= len(text) <= _MAX_TEXT_LEN):
             logging.warning(f"Text length out of bounds: {text}")
-            return None if self.sanitization_policy == 'reject' else text[:max_length]
-
-        if disallowed_patterns.search(text):
-            if self.sanitization_policy == 'reject':
-                logging.warning(f"Disallowed characters found in text: {text}")
-                return None
-            elif self.sanitization_policy == 'remove':
-                text = disallowed_patterns.sub('', text)
-            elif self.sanitization_policy == 'replace':
-                text = disallowed_patterns.sub('?', text)
-        return text
+            return None if self.sanitization_policy == 'reject' else text[:_MAX_TEXT_LEN]
+
+        if self.sanitization_policy == 'reject':
+            logging.warning(f"Disallowed characters found in text: {text}")
+            return None
+
+        table = _TRANSLATE_TABLES.get(self.sanitization_policy)
+        return text.translate(table) if table else text
 
     def additional_checks(self, text):
         """Placeholder for any additional checks on the text.
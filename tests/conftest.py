@@ -0,0 +1,27 @@
+# tests/conftest.py
+
+import pytest
+from mock_environment import MockEnvironmentHandler
+
+@pytest.fixture
+def env_handler_factory():
+    """Return a factory that builds a MockEnvironmentHandler from a list of inputs."""
+    return MockEnvironmentHandler
+
+@pytest.fixture
+def quiz_data_factory():
+    """Return a factory that builds QuizData from question templates without file I/O."""
+    # Imported here so collecting the tests does not load quiz_data
+    from quiz_data import QuizData, _copy_questions
+
+    def make_quiz_data(templates, quiz_length=0):
+        quiz_data = QuizData.__new__(QuizData)
+        quiz_data.filename = 'sample_quiz.json'
+        quiz_data.sanitization_policy = 'reject'
+        quiz_data.quiz_length = quiz_length
+        quiz_data.quiz_info = {}
+        # Each call gets its own question dicts, in the shape the loader produces
+        quiz_data.questions = _copy_questions(templates)
+        return quiz_data
+
+    return make_quiz_data
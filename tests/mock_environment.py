@@ -0,0 +1,56 @@
+# tests/mock_environment.py
+
+import collections
+from quiz_core import EnvironmentHandler
+
+class _OutputLog:
+    """Append-only output log whose membership test is a Counter lookup, not a scan.
+
+    Only append() adds lines, so the list and the Counter cannot drift apart.
+    """
+
+    def __init__(self):
+        self._lines = []
+        self._seen = collections.Counter()
+
+    def append(self, text):
+        self._lines.append(text)
+        self._seen[text] += 1
+
+    def __contains__(self, text):
+        return self._seen[text] > 0
+
+    def count(self, text):
+        return self._seen[text]
+
+    def __getitem__(self, index):
+        return self._lines[index]
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __repr__(self):
+        return repr(self._lines)
+
+class MockEnvironmentHandler(EnvironmentHandler):
+    """Mock environment handler that replays scripted inputs and records outputs."""
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.outputs = _OutputLog()
+        self._input_iter = iter(inputs)
+
+    def input(self, prompt=''):
+        try:
+            user_input = next(self._input_iter)
+        except StopIteration:
+            # Simulate end of inputs
+            return 'quit'
+        self.outputs.append(prompt + user_input)
+        return user_input
+
+    def output(self, text):
+        self.outputs.append(text)
+
+    def close(self):
+        pass  # Do nothing for the mock
@@ -1,45 +1,24 @@
 # tests/test_quiz.py
 
+import copy
 import unittest
-from quiz_core import Quiz, EnvironmentHandler
+from mock_environment import MockEnvironmentHandler
+from quiz_core import Quiz
 from quiz_data import QuizData
 
-class MockEnvironmentHandler(EnvironmentHandler):
-    """Mock environment handler for testing the Quiz class."""
-
-    def __init__(self, inputs):
-        self.inputs = inputs
-        self.outputs = []
-        self.current_input_index = 0
-
-    def input(self, prompt=''):
-        if self.current_input_index < len(self.inputs):
-            user_input = self.inputs[self.current_input_index]
-            self.current_input_index += 1
-            self.outputs.append(prompt + user_input)
-            return user_input
-        else:
-            return 'quit'
-
-    def output(self, text):
-        self.outputs.append(text)
-
-    def close(self):
-        pass  # Do nothing for the mock
-
 class TestQuiz(unittest.TestCase):
     """Unit tests for the Quiz class."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Sample quiz data
-        self.quiz_data = QuizData(
+    @classmethod
+    def setUpClass(cls):
+        """Build the sample quiz data once for the whole class."""
+        cls._template = QuizData(
             filename='sample_quiz.json',
             sanitization_policy='reject',
             quiz_length=10
         )
         # Create sample questions directly to avoid file I/O
-        self.quiz_data.questions = [
+        cls._template.questions = [
             {
                 "question": "What is 2 + 2?",
                 "options": ["3", "4", "5"],
@@ -52,6 +31,13 @@ class TestQuiz(unittest.TestCase):
             }
         ]
 
+    def setUp(self):
+        """Set up test environment."""
+        # Clone the template; tests mutate questions and quiz_info in place.
+        self.quiz_data = copy.copy(self._template)
+        self.quiz_data.questions = [dict(q) for q in self._template.questions]
+        self.quiz_data.quiz_info = dict(self._template.quiz_info)
+
     def test_quiz_flow_correct_answers(self):
         """Test quiz flow where user answers all questions correctly."""
         inputs = ['2', '3']
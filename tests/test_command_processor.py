@@ -6,28 +6,32 @@ from quiz_core import CommandProcessor
 class TestCommandProcessor(unittest.TestCase):
     """Unit tests for the CommandProcessor class."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test environment."""
-        self.command_processor = CommandProcessor()
+        cls.command_processor = CommandProcessor()
 
-    def test_is_command(self):
-        """Test the is_command method with various inputs."""
-        self.assertTrue(self.command_processor.is_command('restart'))
-        self.assertTrue(self.command_processor.is_command('r'))
-        self.assertTrue(self.command_processor.is_command('Skip'))
-        self.assertTrue(self.command_processor.is_command('n'))
-        self.assertTrue(self.command_processor.is_command('?'))
-        self.assertFalse(self.command_processor.is_command('invalid'))
-
-    def test_process_command(self):
-        """Test the process_command method with various inputs."""
-        self.assertEqual(self.command_processor.process_command('restart'), 'restart')
-        self.assertEqual(self.command_processor.process_command('R'), 'restart')
-        self.assertEqual(self.command_processor.process_command('s'), 'skip')
-        self.assertEqual(self.command_processor.process_command('next'), 'skip')
-        self.assertEqual(self.command_processor.process_command('Q'), 'quit')
-        self.assertEqual(self.command_processor.process_command('h'), 'help')
-        self.assertIsNone(self.command_processor.process_command('unknown'))
+    def test_commands(self):
+        """Test is_command and process_command with various inputs."""
+        cases = [
+            # (input, is_command, process_command)
+            ('restart', True, 'restart'),
+            ('r', True, 'restart'),
+            ('R', True, 'restart'),
+            ('Skip', True, 'skip'),
+            ('s', True, 'skip'),
+            ('n', True, 'skip'),
+            ('next', True, 'skip'),
+            ('Q', True, 'quit'),
+            ('h', True, 'help'),
+            ('?', True, 'help'),
+            ('invalid', False, None),
+            ('unknown', False, None)
+        ]
+        for input_str, expected_is, expected_command in cases:
+            with self.subTest(input_str=input_str):
+                self.assertEqual(self.command_processor.is_command(input_str), expected_is)
+                self.assertEqual(self.command_processor.process_command(input_str), expected_command)
 
     def test_get_help_text(self):
         """Test that help text is generated correctly."""
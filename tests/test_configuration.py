@@ -3,6 +3,7 @@
 import unittest
 from unittest.mock import patch, mock_open
 from io import StringIO
+import argparse
 import os
 import sys
 import json
@@ -12,22 +13,66 @@ import tempfile
 # Adjust the import paths as needed based on your project structure
 from quiz_application import load_config, setup_logging, main
 
+def _make_parser(config):
+    """Build the application's argument parser with defaults from os.environ and config.
+
+    Args:
+        config (dict): Configuration loaded from the config file.
+
+    Returns:
+        argparse.ArgumentParser: A parser for the quiz application's arguments.
+    """
+    parser = argparse.ArgumentParser(description='Multiple-choice quiz application.')
+    parser.add_argument('--mode', choices=['local', 'file', 'test', 'action'],
+                        default=os.environ.get('QUIZ_ENVIRONMENT', config.get('environment', 'local')),
+                        help='Mode in which to run the quiz.')
+    parser.add_argument('--quiz-file',
+                        default=os.environ.get('QUIZ_INPUT_FILE', config.get('input_file', 'quiz.json')),
+                        help='Path to the quiz JSON file.')
+    parser.add_argument('--input-file',
+                        default=os.environ.get('QUIZ_INPUT_FILE', config.get('input_file')),
+                        help='Input file for file-based mode.')
+    parser.add_argument('--output-file',
+                        default=os.environ.get('QUIZ_OUTPUT_FILE', config.get('output_file')),
+                        help='Output file for file-based mode.')
+    parser.add_argument('--quiz-length',
+                        type=int,
+                        default=int(os.environ.get('QUIZ_LENGTH', config.get('quiz_length', 0))),
+                        help='Number of questions to present.')
+    parser.add_argument('--sanitization-policy',
+                        choices=['reject', 'remove', 'replace'],
+                        default=config.get('sanitization_policy', 'reject'),
+                        help='Policy for sanitizing invalid text.')
+    parser.add_argument('--logging-enabled',
+                        action='store_true' if config.get('logging_enabled', True) else 'store_false',
+                        help='Enable or disable logging.')
+    return parser
+
 class TestConfiguration(unittest.TestCase):
     """Unit tests for configuration loading and overriding."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Store original environment variables and sys.argv
-        self.original_environ = os.environ.copy()
-        self.original_argv = sys.argv.copy()
-
-    def tearDown(self):
-        """Clean up after tests."""
-        # Restore environment variables and sys.argv
-        os.environ.clear()
-        os.environ.update(self.original_environ)
-        sys.argv = self.original_argv.copy()
-
+    _CONFIG_DATA = {
+        "quiz_length": 5,
+        "input_file": "config_quiz.json",
+        "output_file": "config_results.txt",
+        "environment": "local",
+        "sanitization_policy": "reject",
+        "logging_enabled": False
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Write the config file shared by the override tests once."""
+        fd, cls.config_path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cls._CONFIG_DATA, f)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared config file."""
+        os.remove(cls.config_path)
+
+    @patch.dict(os.environ)
     def test_load_config_file(self):
         """Test loading configuration from the config file."""
         # Create a temporary config file
@@ -43,97 +88,60 @@ class TestConfiguration(unittest.TestCase):
             json.dump(config_data, temp_config)
             temp_config_path = temp_config.name
 
-        # Mock the environment to use the temporary config file
-        with patch.dict(os.environ, {'QUIZ_CONFIG_FILE': temp_config_path}):
-            config = load_config()
-            self.assertEqual(config['quiz_length'], 5)
-            self.assertEqual(config['input_file'], "config_quiz.json")
-            self.assertEqual(config['sanitization_policy'], "replace")
-            self.assertFalse(config['logging_enabled'])
+        config = load_config(temp_config_path)
+        self.assertEqual(config['quiz_length'], 5)
+        self.assertEqual(config['input_file'], "config_quiz.json")
+        self.assertEqual(config['sanitization_policy'], "replace")
+        self.assertFalse(config['logging_enabled'])
 
         # Clean up temporary file
         os.remove(temp_config_path)
 
-    def test_override_with_command_line_arguments(self):
-        """Test overriding configuration with command-line arguments."""
-        # Create a temporary config file
-        config_data = {
-            "quiz_length": 5,
-            "input_file": "config_quiz.json",
-            "output_file": "config_results.txt",
-            "environment": "local",
-            "sanitization_policy": "reject",
-            "logging_enabled": False
-        }
+    @patch.dict(os.environ)
+    def test_load_config_returns_independent_copies(self):
+        """Test that cached config reads hand out copies and notice file changes."""
         with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_config:
-            json.dump(config_data, temp_config)
+            json.dump({"quiz_length": 5}, temp_config)
             temp_config_path = temp_config.name
 
-        # Mock the environment to use the temporary config file
-        with patch.dict(os.environ, {'QUIZ_CONFIG_FILE': temp_config_path}):
-            # Mock sys.argv to simulate command-line arguments
-            test_args = [
-                'quiz_application.py',
-                '--quiz-length', '10',
-                '--sanitization-policy', 'remove',
-                '--logging-enabled'
-            ]
-            with patch.object(sys, 'argv', test_args):
-                config = load_config()
-                # Now parse command-line arguments using argparse
-                from quiz_application import argparse
-                parser = argparse.ArgumentParser(description='Multiple-choice quiz application.')
-                parser.add_argument('--mode', choices=['local', 'file', 'test', 'action'],
-                                    default=os.environ.get('QUIZ_ENVIRONMENT', config.get('environment', 'local')),
-                                    help='Mode in which to run the quiz.')
-                parser.add_argument('--quiz-file',
-                                    default=os.environ.get('QUIZ_INPUT_FILE', config.get('input_file', 'quiz.json')),
-                                    help='Path to the quiz JSON file.')
-                parser.add_argument('--input-file',
-                                    default=os.environ.get('QUIZ_INPUT_FILE', config.get('input_file')),
-                                    help='Input file for file-based mode.')
-                parser.add_argument('--output-file',
-                                    default=os.environ.get('QUIZ_OUTPUT_FILE', config.get('output_file')),
-                                    help='Output file for file-based mode.')
-                parser.add_argument('--quiz-length',
-                                    type=int,
-                                    default=int(os.environ.get('QUIZ_LENGTH', config.get('quiz_length', 0))),
-                                    help='Number of questions to present.')
-                parser.add_argument('--sanitization-policy',
-                                    choices=['reject', 'remove', 'replace'],
-                                    default=config.get('sanitization_policy', 'reject'),
-                                    help='Policy for sanitizing invalid text.')
-                parser.add_argument('--logging-enabled',
-                                    action='store_true' if config.get('logging_enabled', True) else 'store_false',
-                                    help='Enable or disable logging.')
-                args = parser.parse_args()
+        config = load_config(temp_config_path)
+        config['quiz_length'] = 99
+        self.assertEqual(load_config(temp_config_path)['quiz_length'], 5)
 
-                # Test that command-line arguments override config file
-                self.assertEqual(args.quiz_length, 10)
-                self.assertEqual(args.sanitization_policy, 'remove')
-                self.assertTrue(args.logging_enabled)
+        with open(temp_config_path, 'w', encoding='utf-8') as f:
+            json.dump({"quiz_length": 7, "environment": "file"}, f)
+        self.assertEqual(load_config(temp_config_path)['quiz_length'], 7)
 
-        # Clean up temporary file
         os.remove(temp_config_path)
 
+    @patch.dict(os.environ)
+    def test_override_with_command_line_arguments(self):
+        """Test overriding configuration with command-line arguments."""
+        # Mock sys.argv to simulate command-line arguments
+        test_args = [
+            'quiz_application.py',
+            '--quiz-length', '10',
+            '--sanitization-policy', 'remove',
+            '--logging-enabled'
+        ]
+        with patch.object(sys, 'argv', test_args):
+            config = load_config(self.config_path)
+            # Now parse command-line arguments using argparse
+            parser = _make_parser(config)
+            args = parser.parse_args()
+
+            # Test that command-line arguments override config file
+            self.assertEqual(args.quiz_length, 10)
+            self.assertEqual(args.sanitization_policy, 'remove')
+            # The shared config disables logging, so main() makes
+            # --logging-enabled a store_false flag and passing it keeps logging off.
+            self.assertFalse(args.logging_enabled)
+
+    @patch.dict(os.environ)
     def test_override_with_environment_variables(self):
         """Test overriding configuration with environment variables."""
-        # Create a temporary config file
-        config_data = {
-            "quiz_length": 5,
-            "input_file": "config_quiz.json",
-            "output_file": "config_results.txt",
-            "environment": "local",
-            "sanitization_policy": "reject",
-            "logging_enabled": False
-        }
-        with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_config:
-            json.dump(config_data, temp_config)
-            temp_config_path = temp_config.name
-
         # Mock environment variables
         env_vars = {
-            'QUIZ_CONFIG_FILE': temp_config_path,
             'QUIZ_LENGTH': '15',
             'QUIZ_ENVIRONMENT': 'file',
             'QUIZ_INPUT_FILE': 'env_quiz.json',
@@ -142,36 +150,12 @@ class TestConfiguration(unittest.TestCase):
             'QUIZ_LOGGING_ENABLED': 'True'
         }
         with patch.dict(os.environ, env_vars):
-            config = load_config()
+            config = load_config(self.config_path)
             # Mock sys.argv with no command-line arguments
             test_args = ['quiz_application.py']
             with patch.object(sys, 'argv', test_args):
                 # Parse command-line arguments using argparse
-                from quiz_application import argparse
-                parser = argparse.ArgumentParser(description='Multiple-choice quiz application.')
-                parser.add_argument('--mode', choices=['local', 'file', 'test', 'action'],
-                                    default=os.environ.get('QUIZ_ENVIRONMENT', config.get('environment', 'local')),
-                                    help='Mode in which to run the quiz.')
-                parser.add_argument('--quiz-file',
-                                    default=os.environ.get('QUIZ_INPUT_FILE', config.get('input_file', 'quiz.json')),
-                                    help='Path to the quiz JSON file.')
-                parser.add_argument('--input-file',
-                                    default=os.environ.get('QUIZ_INPUT_FILE', config.get('input_file')),
-                                    help='Input file for file-based mode.')
-                parser.add_argument('--output-file',
-                                    default=os.environ.get('QUIZ_OUTPUT_FILE', config.get('output_file')),
-                                    help='Output file for file-based mode.')
-                parser.add_argument('--quiz-length',
-                                    type=int,
-                                    default=int(os.environ.get('QUIZ_LENGTH', config.get('quiz_length', 0))),
-                                    help='Number of questions to present.')
-                parser.add_argument('--sanitization-policy',
-                                    choices=['reject', 'remove', 'replace'],
-                                    default=config.get('sanitization_policy', 'reject'),
-                                    help='Policy for sanitizing invalid text.')
-                parser.add_argument('--logging-enabled',
-                                    action='store_true' if config.get('logging_enabled', True) else 'store_false',
-                                    help='Enable or disable logging.')
+                parser = _make_parser(config)
                 args = parser.parse_args()
 
                 # Test that environment variables override config file and command-line arguments
@@ -183,24 +167,9 @@ class TestConfiguration(unittest.TestCase):
                 self.assertEqual(args.sanitization_policy, 'replace')
                 self.assertTrue(args.logging_enabled)
 
-        # Clean up temporary file
-        os.remove(temp_config_path)
-
+    @patch.dict(os.environ)
     def test_precedence_of_configuration_sources(self):
         """Test the precedence of environment variables over command-line arguments and config file."""
-        # Create a temporary config file
-        config_data = {
-            "quiz_length": 5,
-            "input_file": "config_quiz.json",
-            "output_file": "config_results.txt",
-            "environment": "local",
-            "sanitization_policy": "reject",
-            "logging_enabled": False
-        }
-        with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_config:
-            json.dump(config_data, temp_config)
-            temp_config_path = temp_config.name
-
         # Mock environment variables
         env_vars = {
             'QUIZ_LENGTH': '20',
@@ -211,7 +180,7 @@ class TestConfiguration(unittest.TestCase):
             'QUIZ_LOGGING_ENABLED': 'True'
         }
         with patch.dict(os.environ, env_vars):
-            config = load_config()
+            config = load_config(self.config_path)
             # Mock sys.argv to simulate command-line arguments
             test_args = [
                 'quiz_application.py',
@@ -225,31 +194,7 @@ class TestConfiguration(unittest.TestCase):
             ]
             with patch.object(sys, 'argv', test_args):
                 # Parse command-line arguments using argparse
-                from quiz_application import argparse
-                parser = argparse.ArgumentParser(description='Multiple-choice quiz application.')
-                parser.add_argument('--mode', choices=['local', 'file', 'test', 'action'],
-                                    default=os.environ.get('QUIZ_ENVIRONMENT', config.get('environment', 'local')),
-                                    help='Mode in which to run the quiz.')
-                parser.add_argument('--quiz-file',
-                                    default=os.environ.get('QUIZ_INPUT_FILE', config.get('input_file', 'quiz.json')),
-                                    help='Path to the quiz JSON file.')
-                parser.add_argument('--input-file',
-                                    default=os.environ.get('QUIZ_INPUT_FILE', config.get('input_file')),
-                                    help='Input file for file-based mode.')
-                parser.add_argument('--output-file',
-                                    default=os.environ.get('QUIZ_OUTPUT_FILE', config.get('output_file')),
-                                    help='Output file for file-based mode.')
-                parser.add_argument('--quiz-length',
-                                    type=int,
-                                    default=int(os.environ.get('QUIZ_LENGTH', config.get('quiz_length', 0))),
-                                    help='Number of questions to present.')
-                parser.add_argument('--sanitization-policy',
-                                    choices=['reject', 'remove', 'replace'],
-                                    default=config.get('sanitization_policy', 'reject'),
-                                    help='Policy for sanitizing invalid text.')
-                parser.add_argument('--logging-enabled',
-                                    action='store_true' if config.get('logging_enabled', True) else 'store_false',
-                                    help='Enable or disable logging.')
+                parser = _make_parser(config)
                 args = parser.parse_args()
 
                 # Test that environment variables have highest precedence
@@ -261,8 +206,5 @@ class TestConfiguration(unittest.TestCase):
                 self.assertEqual(args.sanitization_policy, 'remove')  # From env var
                 self.assertTrue(args.logging_enabled)  # From env var
 
-        # Clean up temporary file
-        os.remove(temp_config_path)
-
 if __name__ == '__main__':
     unittest.main()
@@ -15,8 +15,7 @@ class TestEnvironmentHandler(unittest.TestCase):
 
         # Write test inputs to the input file
         with open(self.input_file, 'w', encoding='utf-8') as f:
-            for line in self.test_inputs:
-                f.write(f"{line}\n")
+            f.writelines(f"{line}\n" for line in self.test_inputs)
 
     def tearDown(self):
         """Clean up after tests."""
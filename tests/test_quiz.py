@@ -1,111 +1,88 @@
 # tests/test_quiz.py
 
-import unittest
-from quiz_core import Quiz, EnvironmentHandler
-from quiz_data import QuizData
-
-class MockEnvironmentHandler(EnvironmentHandler):
-    """Mock environment handler for testing the Quiz class."""
-
-    def __init__(self, inputs):
-        self.inputs = inputs
-        self.outputs = []
-        self.current_input_index = 0
-
-    def input(self, prompt=''):
-        if self.current_input_index < len(self.inputs):
-            user_input = self.inputs[self.current_input_index]
-            self.current_input_index += 1
-            self.outputs.append(prompt + user_input)
-            return user_input
-        else:
-            return 'quit'
-
-    def output(self, text):
-        self.outputs.append(text)
-
-    def close(self):
-        pass  # Do nothing for the mock
-
-class TestQuiz(unittest.TestCase):
-    """Unit tests for the Quiz class."""
-
-    def setUp(self):
-        """Set up test environment."""
-        # Sample quiz data
-        self.quiz_data = QuizData(
-            filename='sample_quiz.json',
-            sanitization_policy='reject',
-            quiz_length=10
-        )
-        # Create sample questions directly to avoid file I/O
-        self.quiz_data.questions = [
-            {
-                "question": "What is 2 + 2?",
-                "options": ["3", "4", "5"],
-                "correct": 2
-            },
-            {
-                "question": "What is the capital of France?",
-                "options": ["Berlin", "London", "Paris"],
-                "correct": 3
-            }
-        ]
-
-    def test_quiz_flow_correct_answers(self):
-        """Test quiz flow where user answers all questions correctly."""
-        inputs = ['2', '3']
-        env_handler = MockEnvironmentHandler(inputs)
-        quiz = Quiz(quiz_data=self.quiz_data, env_handler=env_handler)
-        quiz.start()
-
-        self.assertIn("Correct!", env_handler.outputs[-4])
-        self.assertIn("Correct!", env_handler.outputs[-2])
-        self.assertEqual(quiz.correct_answers, 2)
-        self.assertEqual(len(quiz.incorrect_questions), 0)
-
-    def test_quiz_flow_incorrect_answers(self):
-        """Test quiz flow where user answers questions incorrectly."""
-        inputs = ['1', '1']
-        env_handler = MockEnvironmentHandler(inputs)
-        quiz = Quiz(quiz_data=self.quiz_data, env_handler=env_handler)
-        quiz.start()
-
-        self.assertIn("Incorrect.", env_handler.outputs[-4])
-        self.assertIn("Incorrect.", env_handler.outputs[-2])
-        self.assertEqual(quiz.correct_answers, 0)
-        self.assertEqual(len(quiz.incorrect_questions), 2)
-
-    def test_quiz_flow_with_commands(self):
-        """Test quiz flow with user commands like 'skip' and 'help'."""
-        inputs = ['help', 's', '2', 'quit']
-        env_handler = MockEnvironmentHandler(inputs)
-        quiz = Quiz(quiz_data=self.quiz_data, env_handler=env_handler)
-        quiz.start()
-
-        self.assertIn("Available commands:", env_handler.outputs)
-        self.assertIn("Skipped questions: 1", env_handler.outputs[-3])
-
-    def test_quiz_restart(self):
-        """Test the 'restart' command during the quiz."""
-        inputs = ['restart', '2', '3']
-        env_handler = MockEnvironmentHandler(inputs)
-        quiz = Quiz(quiz_data=self.quiz_data, env_handler=env_handler)
-        quiz.start()
-
-        self.assertEqual(quiz.correct_answers, 2)
-        self.assertEqual(len(quiz.incorrect_questions), 0)
-
-    def test_invalid_input(self):
-        """Test handling of invalid user inputs."""
-        inputs = ['invalid', '5', '2', '3']
-        env_handler = MockEnvironmentHandler(inputs)
-        quiz = Quiz(quiz_data=self.quiz_data, env_handler=env_handler)
-        quiz.start()
-
-        self.assertIn("Invalid input", env_handler.outputs)
-        self.assertIn("Invalid option number", env_handler.outputs)
-        self.assertEqual(quiz.correct_answers, 2)
-
-if __name__ == '__main__':
-    unittest.main()
+import json
+import random
+import pytest
+from types import MappingProxyType
+from quiz_core import CommandProcessor, Quiz
+
+# Read-only question templates; each test gets its own copy in loader shape.
+_QUESTIONS = (
+    MappingProxyType({
+        "question": "What is 2 + 2?",
+        "options": ["3", "4", "5"],
+        "correct": 2
+    }),
+    MappingProxyType({
+        "question": "What is the capital of France?",
+        "options": ["Berlin", "London", "Paris"],
+        "correct": 3
+    })
+)
+
+@pytest.fixture(autouse=True)
+def file_order(monkeypatch):
+    """Ask questions in file order so the scripted answers line up with them."""
+    monkeypatch.setattr(random, 'sample', lambda population, k: list(population)[:k])
+
+@pytest.fixture
+def quiz_data(quiz_data_factory):
+    """Sample quiz data with two questions, which tests may modify."""
+    return quiz_data_factory(_QUESTIONS, quiz_length=10)
+
+@pytest.mark.parametrize("inputs,feedback,correct,incorrect", [
+    (['2', '3'], "Correct!", 2, 0),
+    (['1', '1'], "Incorrect.", 0, 2)
+], ids=['correct_answers', 'incorrect_answers'])
+def test_quiz_flow(quiz_data, env_handler_factory, inputs, feedback, correct, incorrect):
+    """Test quiz flow where user answers all questions correctly or all incorrectly."""
+    env_handler = env_handler_factory(inputs)
+    quiz = Quiz(quiz_data=quiz_data, env_handler=env_handler)
+    quiz.start()
+
+    assert env_handler.outputs.count(feedback) == 2
+    assert quiz.correct_answers == correct
+    assert len(quiz.incorrect_questions) == incorrect
+
+def test_quiz_flow_with_commands(quiz_data, env_handler_factory):
+    """Test quiz flow with user commands like 'skip' and 'help'."""
+    env_handler = env_handler_factory(['help', 's', '2', 'quit'])
+    quiz = Quiz(quiz_data=quiz_data, env_handler=env_handler)
+    quiz.start()
+
+    assert CommandProcessor().get_help_text() in env_handler.outputs
+    # The results summary is the last output entry
+    assert "Skipped questions: 1" in env_handler.outputs[-1]
+
+def test_quiz_restart(quiz_data, env_handler_factory):
+    """Test the 'restart' command during the quiz."""
+    env_handler = env_handler_factory(['restart', '2', '3'])
+    quiz = Quiz(quiz_data=quiz_data, env_handler=env_handler)
+    quiz.start()
+
+    assert quiz.correct_answers == 2
+    assert len(quiz.incorrect_questions) == 0
+
+def test_invalid_input(quiz_data, env_handler_factory):
+    """Test handling of invalid user inputs."""
+    env_handler = env_handler_factory(['invalid', '5', '2', '3'])
+    quiz = Quiz(quiz_data=quiz_data, env_handler=env_handler)
+    quiz.start()
+
+    assert "Invalid input. Please enter a valid option number or command." in env_handler.outputs
+    assert "Invalid option number. Please try again." in env_handler.outputs
+    assert quiz.correct_answers == 2
+
+def test_edited_question_is_displayed(env_handler_factory):
+    """Test that edits to a loaded question's fields show up when it is asked."""
+    from quiz_data import QuizData
+    quiz_data = QuizData(data=json.dumps({"questions": [
+        {"question": "What is 2 + 2?", "options": ["3", "4", "5"], "correct": 2}
+    ]}))
+    quiz_data.questions[0]['question'] = "What is 3 + 3?"
+    quiz_data.questions[0]['options'][0] = "6"
+    env_handler = env_handler_factory(['1'])
+    quiz = Quiz(quiz_data=quiz_data, env_handler=env_handler)
+    quiz.start()
+
+    assert "Question 1: What is 3 + 3?\n1. 6\n2. 4\n3. 5" in env_handler.outputs[0]
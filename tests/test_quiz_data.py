@@ -1,17 +1,21 @@
 # tests/test_quiz_data.py
 
 import unittest
+from unittest.mock import patch
+import quiz_data as quiz_data_module
 from quiz_data import QuizData
 import json
 import os
+import tempfile
 
 class TestQuizData(unittest.TestCase):
     """Unit tests for the QuizData class."""
 
-    def setUp(self):
-        """Set up test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Write the sample quiz once and load it under each policy."""
         # Create a sample quiz JSON data
-        self.sample_quiz = {
+        cls.sample_quiz = {
             "title": "Sample Quiz",
             "description": "A sample description.",
             "questions": [
@@ -39,14 +43,22 @@ class TestQuizData(unittest.TestCase):
         }
 
         # Write the sample quiz data to a temporary file
-        self.quiz_file = 'temp_quiz.json'
-        with open(self.quiz_file, 'w', encoding='utf-8') as f:
-            json.dump(self.sample_quiz, f)
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8',
+                                         delete=False) as f:
+            json.dump(cls.sample_quiz, f)
+        cls.quiz_file = f.name
+
+        # Read-only tests share one instance per sanitization policy
+        cls._quiz_data = {
+            policy: QuizData(filename=cls.quiz_file, sanitization_policy=policy, quiz_length=10)
+            for policy in ('reject', 'remove', 'replace')
+        }
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up after tests."""
-        if os.path.exists(self.quiz_file):
-            os.remove(self.quiz_file)
+        if os.path.exists(cls.quiz_file):
+            os.remove(cls.quiz_file)
 
     def test_load_quiz_data(self):
         """Test loading and sanitizing quiz data."""
@@ -59,13 +71,89 @@ class TestQuizData(unittest.TestCase):
         self.assertEqual(len(quiz_data.questions), 1)
         self.assertEqual(quiz_data.questions[0]['question'], "What is 2 + 2?")
 
+    def test_load_quiz_data_returns_independent_copies(self):
+        """Test that repeated loads of a file do not share question objects."""
+        first = QuizData(filename=self.quiz_file, sanitization_policy='reject', quiz_length=10)
+        first.questions[0]['options'].append("6")
+        first.questions.clear()
+        second = QuizData(filename=self.quiz_file, sanitization_policy='reject', quiz_length=10)
+        self.assertEqual(len(second.questions), 1)
+        self.assertEqual(second.questions[0]['options'], ["3", "4", "5"])
+
+    def test_reload_does_not_cache_edited_questions(self):
+        """Test that questions set on an instance before a reload stay out of the load cache."""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8',
+                                         delete=False) as f:
+            json.dump(self.sample_quiz, f)
+        self.addCleanup(os.remove, f.name)
+
+        quiz_data = QuizData.__new__(QuizData)
+        quiz_data.filename = f.name
+        quiz_data.sanitization_policy = 'remove'
+        quiz_data.quiz_info = {}
+        quiz_data.questions = [{"question": "Edited in memory", "options": ["Yes"], "correct": 1}]
+        quiz_data.load_quiz_data()
+
+        reloaded = QuizData(filename=f.name, sanitization_policy='remove')
+        self.assertNotIn("Edited in memory", [q['question'] for q in reloaded.questions])
+        self.assertEqual(len(reloaded.questions), len(quiz_data.questions) - 1)
+
+    def test_load_quiz_data_skips_non_text_question(self):
+        """Test that a question whose text is not a string is skipped, not rendered."""
+        document = json.dumps({"questions": [
+            {"question": 123, "options": ["Yes", "No"], "correct": 1},
+            {"question": "What is 2 + 2?", "options": ["3", "4", "5"], "correct": 2}
+        ]})
+        for policy in ('reject', 'remove', 'replace'):
+            with self.subTest(policy=policy):
+                quiz_data = QuizData(sanitization_policy=policy, data=document)
+                self.assertEqual([q['question'] for q in quiz_data.questions], ["What is 2 + 2?"])
+
+    def test_load_quiz_data_skips_non_text_options(self):
+        """Test that every policy skips a question with non-string options."""
+        document = json.dumps({"questions": [
+            {"question": "Pick one", "options": [1, "Two"], "correct": 1},
+            {"question": "What is 2 + 2?", "options": ["3", "4", "5"], "correct": 2}
+        ]})
+        for policy in ('reject', 'remove', 'replace'):
+            with self.subTest(policy=policy):
+                quiz_data = QuizData(sanitization_policy=policy, data=document)
+                self.assertEqual([q['question'] for q in quiz_data.questions], ["What is 2 + 2?"])
+
+    @unittest.skipIf(quiz_data_module.ijson is None, "ijson is not installed")
+    def test_load_quiz_data_streaming(self):
+        """Test the ijson streaming path, including a reload of the same instance."""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8',
+                                         delete=False) as f:
+            json.dump(self.sample_quiz, f)
+        self.addCleanup(os.remove, f.name)
+
+        # Stream every file, however small
+        with patch.object(quiz_data_module, '_STREAM_THRESHOLD', 0):
+            quiz_data = QuizData(filename=f.name, sanitization_policy='reject', quiz_length=10)
+            self.assertEqual([q['question'] for q in quiz_data.questions], ["What is 2 + 2?"])
+            self.assertEqual(quiz_data.quiz_info, {"title": "Sample Quiz",
+                                                   "description": "A sample description."})
+
+            with open(f.name, 'w', encoding='utf-8') as reloaded:
+                json.dump({"subtitle": "Reloaded", "questions": self.sample_quiz['questions']}, reloaded)
+            quiz_data.load_quiz_data()
+            self.assertEqual(quiz_data.quiz_info, {"subtitle": "Reloaded"})
+
+    def test_sanitize_questions_leaves_input_unchanged(self):
+        """Test that every policy leaves the raw question dicts as they were."""
+        raw_question = {"question": "What is 2 + 2?", "options": ["3", "4", "5"], "correct": 2}
+        for policy in ('reject', 'remove', 'replace'):
+            with self.subTest(policy=policy):
+                original = dict(raw_question, options=list(raw_question['options']))
+                questions = self._quiz_data[policy]._sanitize_questions([raw_question])
+                self.assertEqual(questions, [original])
+                self.assertIsNot(questions[0], raw_question)
+                self.assertEqual(raw_question, original)
+
     def test_validate_question(self):
         """Test the question validation method."""
-        quiz_data = QuizData(
-            filename=self.quiz_file,
-            sanitization_policy='reject',
-            quiz_length=10
-        )
+        quiz_data = self._quiz_data['reject']
         valid_question = {
             "question": "Valid question?",
             "options": ["Yes", "No"],
@@ -80,17 +168,25 @@ class TestQuizData(unittest.TestCase):
             "options": ["Option 1", "Option 2"],
             "correct": 3
         }
+        invalid_question_bool_correct = {
+            "question": "Boolean correct field",
+            "options": ["Yes", "No"],
+            "correct": True
+        }
+        invalid_question_non_str_text = {
+            "question": 123,
+            "options": ["Yes", "No"],
+            "correct": 1
+        }
         self.assertTrue(quiz_data.validate_question(valid_question))
         self.assertFalse(quiz_data.validate_question(invalid_question_missing_field))
         self.assertFalse(quiz_data.validate_question(invalid_question_wrong_correct))
+        self.assertFalse(quiz_data.validate_question(invalid_question_bool_correct))
+        self.assertFalse(quiz_data.validate_question(invalid_question_non_str_text))
 
     def test_sanitize_text_reject_policy(self):
         """Test sanitization with 'reject' policy."""
-        quiz_data = QuizData(
-            filename=self.quiz_file,
-            sanitization_policy='reject',
-            quiz_length=10
-        )
+        quiz_data = self._quiz_data['reject']
         # Valid text
         sanitized = quiz_data.sanitize_text("Valid text.")
         self.assertEqual(sanitized, "Valid text.")
@@ -101,31 +197,20 @@ class TestQuizData(unittest.TestCase):
 
     def test_sanitize_text_remove_policy(self):
         """Test sanitization with 'remove' policy."""
-        quiz_data = QuizData(
-            filename=self.quiz_file,
-            sanitization_policy='remove',
-            quiz_length=10
-        )
+        quiz_data = self._quiz_data['remove']
         sanitized = quiz_data.sanitize_text("Invalid text <script>")
-        self.assertEqual(sanitized, "Invalid text ")
+        # Only the disallowed characters go, not the text between them
+        self.assertEqual(sanitized, "Invalid text script")
 
     def test_sanitize_text_replace_policy(self):
         """Test sanitization with 'replace' policy."""
-        quiz_data = QuizData(
-            filename=self.quiz_file,
-            sanitization_policy='replace',
-            quiz_length=10
-        )
+        quiz_data = self._quiz_data['replace']
         sanitized = quiz_data.sanitize_text("Invalid text <script>")
         self.assertEqual(sanitized, "Invalid text ?script?")
 
     def test_additional_checks(self):
         """Test the placeholder for additional checks."""
-        quiz_data = QuizData(
-            filename=self.quiz_file,
-            sanitization_policy='reject',
-            quiz_length=10
-        )
+        quiz_data = self._quiz_data['reject']
         # Assuming additional_checks always returns True for now
         self.assertTrue(quiz_data.additional_checks("Some text"))
 